@@ -2,6 +2,9 @@
 
 Records Python audit events as JSONL for ModelFP runtime evidence.
 This is telemetry, not a sandbox. Run the target inside a separate container/VM.
+
+By default every event is recorded. Set MODELFP_AUDIT_EVENTS=sensitive to keep
+only process, code-loading, file, and network events on import-heavy targets.
 """
 
 from __future__ import annotations
@@ -30,7 +33,19 @@ def _redact(text: str) -> str:
     return out
 
 
+# Extra characters cut past max_len before redaction. They are dropped again
+# afterwards, so a secret split by the cut never reaches the log half-redacted.
+_REPR_SLACK = 256
+
+
 def safe_repr(obj: Any, max_len: int = 700) -> str:
+    # Large buffers (marshal.loads, exec of source, open paths) are cut before
+    # repr/redaction instead of formatting and scanning bytes that get dropped.
+    if isinstance(obj, (str, bytes, bytearray)) and len(obj) > max_len + _REPR_SLACK:
+        value = _redact(repr(obj[: max_len + _REPR_SLACK]))[:-_REPR_SLACK]
+        if len(value) >= max_len:
+            return value[:max_len] + "...<truncated>"
+        # Redaction shrank the cut text past the slack; fall back to the whole value.
     try:
         value = repr(obj)
     except Exception:
@@ -44,15 +59,35 @@ def safe_repr(obj: Any, max_len: int = 700) -> str:
 def _open_log_file() -> Any:
     log_path = os.environ.get("MODELFP_AUDIT_LOG", "/workspace/out/traces/python_audit.jsonl")
     Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+    # Line-buffered on purpose: fork children (multiprocessing workers included)
+    # exit through os._exit and targets may be killed on timeout, so records held
+    # in a userspace buffer would be lost.
     return open(log_path, "a", encoding="utf-8", buffering=1)
 
 
+# Event names kept by MODELFP_AUDIT_EVENTS=sensitive; socket.* is matched by prefix.
+SENSITIVE_EVENTS = frozenset({
+    "exec", "eval", "compile", "open", "os.open", "os.system", "os.exec", "os.fork", "os.forkpty",
+    "os.posix_spawn", "os.spawn", "os.kill", "os.remove", "os.rename", "os.rmdir", "os.chmod",
+    "os.putenv", "os.unsetenv", "subprocess.Popen", "shutil.rmtree", "ctypes.dlopen",
+    "pickle.find_class", "marshal.load", "marshal.loads", "urllib.Request",
+    "http.client.connect", "ftplib.connect", "smtplib.connect", "sys.addaudithook",
+})
+SENSITIVE_EVENT_PREFIXES = ("socket.",)
+
 _LOG_FP = None
 _IN_HOOK = False
+_SENSITIVE_ONLY = False
+# The runner sets MODELFP_PHASE before registering the hook, so it is read once
+# there. pid/ppid stay per event: a target can fork through libc, bypassing
+# os.register_at_fork, and temporal rules key on the pid.
+_PHASE = "RUNTIME"
 
 
 def audit_all_hook(event: str, args: Iterable[Any]) -> None:
     global _IN_HOOK, _LOG_FP
+    if _SENSITIVE_ONLY and event not in SENSITIVE_EVENTS and not event.startswith(SENSITIVE_EVENT_PREFIXES):
+        return
     if _IN_HOOK:
         return
     _IN_HOOK = True
@@ -63,12 +98,17 @@ def audit_all_hook(event: str, args: Iterable[Any]) -> None:
             "time": time.time(),
             "pid": os.getpid(),
             "ppid": os.getppid(),
-            "phase": os.environ.get("MODELFP_PHASE", "RUNTIME"),
+            "phase": _PHASE,
             "source": "python_audit",
             "op": event,
             "args": [safe_repr(a) for a in args],
             "result": "observed",
         }
+        if event == "sys.addaudithook":
+            # Attribute hook installs to the calling frame, not to a path inside args,
+            # so targets layering their own hooks over the recorder are identifiable.
+            frame = sys._getframe(1)
+            record["caller"] = f"{frame.f_code.co_filename}:{frame.f_lineno}"
         _LOG_FP.write(json.dumps(record, ensure_ascii=False) + "\n")
     except Exception:
         # Audit hooks should not crash the target unless enforcement is explicitly enabled.
@@ -78,7 +118,9 @@ def audit_all_hook(event: str, args: Iterable[Any]) -> None:
 
 
 def register_all_audit_hook() -> None:
-    global _LOG_FP
+    global _LOG_FP, _SENSITIVE_ONLY, _PHASE
+    _SENSITIVE_ONLY = os.environ.get("MODELFP_AUDIT_EVENTS", "all").lower() == "sensitive"
+    _PHASE = os.environ.get("MODELFP_PHASE", "RUNTIME")
     try:
         _LOG_FP = _open_log_file()
     except Exception:
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any, Iterable
 
 
+HUB_URL_PREFIX_RE = re.compile(r"^https?://(huggingface.co|github.com)/")
 SEVERITY_ORDER = {"info": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
 PALETTE = {
     "ink": "#17202a",
@@ -63,7 +64,7 @@ def load_json(path: Path) -> Any:
 
 def safe_label(value: str, limit: int = 42) -> str:
     value = value.strip() or "unknown"
-    value = re.sub(r"^https?://(huggingface.co|github.com)/", "", value)
+    value = HUB_URL_PREFIX_RE.sub("", value)
     value = value.removesuffix(".git")
     if len(value) <= limit:
         return value
@@ -30,7 +30,16 @@ def _redact(text: str) -> str:
     return out
 
 
+_REPR_SLACK = 256
+
+
 def _safe_repr(value: Any, max_len: int = 600) -> str:
+    # Cut large buffers before repr/redaction, then drop the slack again so a
+    # secret split by the cut is never logged half-redacted.
+    if isinstance(value, (str, bytes, bytearray)) and len(value) > max_len + _REPR_SLACK:
+        text = _redact(repr(value[: max_len + _REPR_SLACK]))[:-_REPR_SLACK]
+        if len(text) >= max_len:
+            return text[:max_len] + "...<truncated>"
     try:
         text = repr(value)
     except Exception:
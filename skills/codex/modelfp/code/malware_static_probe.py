@@ -42,11 +42,20 @@ MALWARE_TEXT_PATTERNS: list[tuple[str, str, re.Pattern[str], str]] = [
     ("chmod_then_execute", "medium", re.compile(r"\bchmod\s+\+x\b[^\n]{0,200}(?:&&|;)\s*\./", re.I), "Script grants execute permission and immediately runs a local file."),
 ]
 
+# All text rules fused into one alternation so benign lines cost a single scan;
+# only lines that hit it are re-checked rule by rule to report every match.
+MALWARE_TEXT_ANY_RE = re.compile("|".join(f"(?:{pattern.pattern})" for _label, _sev, pattern, _meaning in MALWARE_TEXT_PATTERNS), re.I)
+PAYLOAD_URL_CONTEXT_TOKENS = ("download", "payload", "raw.githubusercontent", "pastebin", "gist.githubusercontent", "cdn.discordapp")
 LONG_BASE64_RE = re.compile(r"(?<![A-Za-z0-9+/])(?:[A-Za-z0-9+/]{120,}={0,2})(?![A-Za-z0-9+/])")
 URL_RE = re.compile(r"https?://[^\s)\"'\]]+", re.I)
 IP_LITERAL_RE = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b")
 
 
+def _has_payload_url_context(line: str) -> bool:
+    lowered = line.lower()
+    return any(token in lowered for token in PAYLOAD_URL_CONTEXT_TOKENS)
+
+
 def _node(idx: int, finding: str, severity: str, meaning: str, **extra: Any) -> dict[str, Any]:
     return {
         "id": f"MW{idx:04d}",
@@ -140,12 +149,14 @@ def scan_repo(repo: Path, max_files: int = 10000) -> tuple[list[dict[str, Any]],
         scanned_text += 1
         text = path.read_text(errors="ignore")
         for line_no, line in enumerate(text.splitlines(), start=1):
-            for label, severity, pattern, meaning in MALWARE_TEXT_PATTERNS:
-                if pattern.search(line):
-                    nodes.append(_node(idx, label, severity, meaning, path=rel, line_no=line_no, excerpt=line.strip()[:600]))
-                    idx += 1
-            for url in URL_RE.findall(line)[:5]:
-                if any(token in line.lower() for token in ["download", "payload", "raw.githubusercontent", "pastebin", "gist.githubusercontent", "cdn.discordapp"]):
+            if MALWARE_TEXT_ANY_RE.search(line):
+                for label, severity, pattern, meaning in MALWARE_TEXT_PATTERNS:
+                    if pattern.search(line):
+                        nodes.append(_node(idx, label, severity, meaning, path=rel, line_no=line_no, excerpt=line.strip()[:600]))
+                        idx += 1
+            urls = URL_RE.findall(line)[:5]
+            if urls and _has_payload_url_context(line):
+                for url in urls:
                     nodes.append(_node(idx, "suspicious_payload_url_context", "medium", "URL appears in a payload/download context.", path=rel, line_no=line_no, url=url[:500], excerpt=line.strip()[:600]))
                     idx += 1
             for ip in IP_LITERAL_RE.findall(line)[:5]:
@@ -20,6 +20,16 @@ from typing import List, Optional
 HERE = Path(__file__).resolve().parent
 ROOT = HERE.parent
 
+# Syscalls trace_normalizer classifies, plus kernel-module/mount/ptrace abuse.
+# Filtering at the source keeps strace logs (and the parse after them) small.
+# Each name is passed with strace's "?" prefix because legacy calls such as
+# open/creat/rename do not exist on arm64.
+STRACE_SYSCALLS = (
+    "open", "openat", "creat", "execve", "execveat", "unlink", "unlinkat", "rename", "renameat", "renameat2",
+    "chmod", "fchmod", "ftruncate", "socket", "connect", "read", "write", "sendto", "recvfrom",
+    "ptrace", "mount", "init_module", "finit_module", "delete_module",
+)
+
 
 def running_inside_container() -> bool:
     if Path("/.dockerenv").exists():
@@ -40,11 +50,12 @@ def run(cmd: List[str], *, cwd: Optional[Path] = None, env: Optional[dict] = Non
     stdout = stdout_path.open("w", encoding="utf-8") if stdout_path else subprocess.PIPE
     stderr = stderr_path.open("w", encoding="utf-8") if stderr_path else subprocess.PIPE
     try:
-        proc = subprocess.run(cmd, cwd=str(cwd) if cwd else None, env=env, stdout=stdout, stderr=stderr, text=True, timeout=timeout)
+        # Captured output stays bytes; only the tail that is echoed gets decoded.
+        proc = subprocess.run(cmd, cwd=str(cwd) if cwd else None, env=env, stdout=stdout, stderr=stderr, timeout=timeout)
         if stdout_path is None and proc.stdout:
-            print(proc.stdout[-4000:])
+            print(proc.stdout[-4000:].decode("utf-8", errors="replace"))
         if stderr_path is None and proc.stderr:
-            print(proc.stderr[-4000:], file=sys.stderr)
+            print(proc.stderr[-4000:].decode("utf-8", errors="replace"), file=sys.stderr)
         return proc.returncode
     except subprocess.TimeoutExpired:
         print(f"[ModelFP] command timed out after {timeout}s", file=sys.stderr)
@@ -71,6 +82,7 @@ def write_manifest(out_dir: Path, args: argparse.Namespace, target_rc: Optional[
         "skip_modelscan": args.skip_modelscan,
         "target_returncode": target_rc,
         "runtime_timeout_seconds": args.timeout,
+        "strace_syscalls": args.strace_syscalls,
         "containerized": running_inside_container(),
         "host_execution_allowed": args.allow_host,
         "network_note": "Runtime container should normally be launched with --network none unless explicitly testing network behavior.",
@@ -92,6 +104,7 @@ def main() -> int:
     parser.add_argument("--skip-runtime", action="store_true")
     parser.add_argument("--skip-modelscan", action="store_true")
     parser.add_argument("--max-llm-events", type=int, default=250)
+    parser.add_argument("--strace-syscalls", default=os.environ.get("MODELFP_STRACE_SYSCALLS", ",".join("?" + name for name in STRACE_SYSCALLS)), help="Comma-separated strace -e trace= filter, or 'all' to trace every syscall")
     parser.add_argument("--allow-host", action="store_true", help="Development escape hatch: allow running outside Docker. Do not use for normal audits.")
     parser.add_argument("target_args", nargs=argparse.REMAINDER, help="Args after -- are passed to target script")
     args = parser.parse_args()
@@ -145,8 +158,9 @@ def main() -> int:
             stderr_log = out_dir / "traces/target_stderr.log"
             strace_prefix = out_dir / "traces/strace"
             passthrough = [x for x in args.target_args if x != "--"]
+            strace_filter = [] if args.strace_syscalls == "all" else ["-e", "trace=" + args.strace_syscalls]
             cmd = [
-                "strace", "-ff", "-tt", "-T", "-yy", "-s", "4096", "-o", str(strace_prefix),
+                "strace", "-ff", "-qq", "-tt", "-T", "-yy", "-s", "4096", *strace_filter, "-o", str(strace_prefix),
                 sys.executable, str(HERE / "audit_runner.py"),
                 "--script", str(target_script),
                 "--audit-log", str(audit_log),
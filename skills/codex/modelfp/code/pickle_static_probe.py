@@ -54,7 +54,6 @@ def _pickle_members(path: Path) -> Iterable[Tuple[str, bytes]]:
 
 def _scan_pickle_bytes(data: bytes) -> Dict[str, Any]:
     globals_seen: List[str] = []
-    dangerous: List[str] = []
     op_counts: Dict[str, int] = {}
     stack: List[str] = []
     reduce_count = 0
@@ -70,8 +69,6 @@ def _scan_pickle_bytes(data: bytes) -> Dict[str, Any]:
         if op.name == "GLOBAL":
             ref = str(arg).replace(" ", ".")
             globals_seen.append(ref)
-            if DANGEROUS_RE.search(ref):
-                dangerous.append(ref)
             continue
         if op.name == "STACK_GLOBAL":
             if len(stack) >= 2:
@@ -81,15 +78,15 @@ def _scan_pickle_bytes(data: bytes) -> Dict[str, Any]:
             else:
                 ref = "<unresolved STACK_GLOBAL>"
             globals_seen.append(ref)
-            if DANGEROUS_RE.search(ref):
-                dangerous.append(ref)
             continue
         if op.name == "REDUCE":
             reduce_count += 1
 
+    # Checkpoints repeat the same few globals thousands of times; classify each once.
+    global_refs = sorted(set(globals_seen))
     return {
-        "global_refs": sorted(set(globals_seen)),
-        "dangerous_refs": sorted(set(dangerous)),
+        "global_refs": global_refs,
+        "dangerous_refs": [ref for ref in global_refs if DANGEROUS_RE.search(ref)],
         "opcode_counts": op_counts,
         "reduce_count": reduce_count,
     }
@@ -44,6 +44,7 @@ SENSITIVE_IMPORT_ROOTS = {
 }
 
 HANDLER_NAMES = {"execute", "handler", "lambda_handler"}
+URL_RE = re.compile(r"https?://[^\s\"')]+")
 LOG_EVENT_RE = re.compile(r"logger\.(?:debug|info|warning|error|exception)\([^\n]*\bevent\b", re.I)
 PUBLIC_PYPI_HOSTS = {"pypi.org", "files.pythonhosted.org", "pypi.python.org"}
 
@@ -189,7 +190,7 @@ def _scan_package_indexes(repo: Path, idx: int) -> tuple[List[Dict[str, Any]], i
         if not path.exists() or not path.is_file():
             continue
         text = path.read_text(errors="ignore")
-        urls = sorted(set(re.findall(r"https?://[^\s\"')]+", text)))
+        urls = sorted(set(URL_RE.findall(text)))
         for url in urls:
             host = urlparse(url).hostname or ""
             if host and host not in PUBLIC_PYPI_HOSTS:
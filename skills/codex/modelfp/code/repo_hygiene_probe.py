@@ -111,6 +111,10 @@ ARCHITECTURE_FAMILIES = [
     (re.compile(r"(Vision|Image|ViT|Swin|CLIP)", re.I), "vision"),
     (re.compile(r"(Whisper|Wav2Vec|Audio)", re.I), "audio"),
 ]
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*(?:\n|$)", re.S)
+COMMIT_HASH_RE = re.compile(r"\b[0-9a-f]{7,40}\b")
+DIGITS_RE = re.compile(r"\d+")
+WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _node(idx: int, finding: str, severity: str, meaning: str, **extra: Any) -> Dict[str, Any]:
@@ -144,7 +148,7 @@ def _read_text(path: Path, max_bytes: int = 512_000) -> str:
 def _frontmatter(text: str) -> Dict[str, Any]:
     if yaml is None or not text.startswith("---"):
         return {}
-    match = re.match(r"^---\s*\n(.*?)\n---\s*(?:\n|$)", text, flags=re.S)
+    match = FRONTMATTER_RE.match(text)
     if not match:
         return {}
     try:
@@ -175,9 +179,9 @@ def _rel(repo: Path, path: Path) -> str:
 
 def _normal_commit_text(commit: Mapping[str, Any]) -> str:
     text = " ".join(str(commit.get(k) or "") for k in ("title", "message")).strip().lower()
-    text = re.sub(r"\b[0-9a-f]{7,40}\b", "<hash>", text)
-    text = re.sub(r"\d+", "<num>", text)
-    return re.sub(r"\s+", " ", text)
+    text = COMMIT_HASH_RE.sub("<hash>", text)
+    text = DIGITS_RE.sub("<num>", text)
+    return WHITESPACE_RE.sub(" ", text)
 
 
 def _parse_time(value: Any) -> datetime | None:
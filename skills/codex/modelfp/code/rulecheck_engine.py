@@ -10,13 +10,19 @@ which are validated separately before promotion.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 Evidence = Dict[str, Any]
 Rule = Dict[str, Any]
 Certificate = Dict[str, Any]
+EvidenceIndex = Dict[Tuple[str, Any], List[Evidence]]
 
 SEVERITY_ORDER = {"info": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
+MAX_TEMPORAL_CERTIFICATES = 50  # avoid certificate explosion in MVP
+
+
+class _CertificateLimitReached(Exception):
+    """Unwinds the temporal backtracking search once enough witnesses exist."""
 
 
 def severity_at_least(actual: str, minimum: str) -> bool:
@@ -41,6 +47,27 @@ def matches(ev: Evidence, cond: Mapping[str, Any]) -> bool:
     return True
 
 
+# Plain-equality keys that cross-layer conditions select on. Indexing evidence by
+# them lets each side of a rule scan only the nodes sharing its value.
+INDEXED_KEYS = ("evidence_type", "source", "op")
+
+
+def index_evidence(evidence_nodes: Iterable[Evidence]) -> EvidenceIndex:
+    index: EvidenceIndex = {}
+    for ev in evidence_nodes:
+        for key in INDEXED_KEYS:
+            value = ev.get(key)
+            if isinstance(value, str):
+                index.setdefault((key, value), []).append(ev)
+    return index
+
+
+def candidate_evidence(index: EvidenceIndex, evidence_nodes: List[Evidence], cond: Mapping[str, Any]) -> List[Evidence]:
+    """Smallest indexed bucket a condition can match, in evidence order."""
+    buckets = [index.get((key, cond[key]), []) for key in INDEXED_KEYS if isinstance(cond.get(key), str)]
+    return min(buckets, key=len) if buckets else evidence_nodes
+
+
 def flatten_policy(policy: Mapping[str, Any]) -> List[Rule]:
     rules: List[Rule] = []
     for section, default_type in [
@@ -90,13 +117,15 @@ def find_single_evidence_certificates(model: str, revision: str, run_id: str, ru
     return certs
 
 
-def find_cross_layer_certificates(model: str, revision: str, run_id: str, rule: Rule, evidence_nodes: List[Evidence]) -> List[Certificate]:
+def find_cross_layer_certificates(model: str, revision: str, run_id: str, rule: Rule, evidence_nodes: List[Evidence], index: Optional[EvidenceIndex] = None) -> List[Certificate]:
     conds = rule.get("conditions", {})
     static_cond = conds.get("static", {})
     runtime_cond = conds.get("runtime", {})
+    if index is None:
+        index = index_evidence(evidence_nodes)
 
-    static_matches = [ev for ev in evidence_nodes if matches(ev, static_cond)]
-    runtime_matches = [ev for ev in evidence_nodes if matches(ev, runtime_cond)]
+    static_matches = [ev for ev in candidate_evidence(index, evidence_nodes, static_cond) if matches(ev, static_cond)]
+    runtime_matches = [ev for ev in candidate_evidence(index, evidence_nodes, runtime_cond) if matches(ev, runtime_cond)]
 
     certs: List[Certificate] = []
     for s in static_matches:
@@ -187,6 +216,8 @@ def find_temporal_certificates(model: str, revision: str, run_id: str, rule: Rul
                 "evidence": evidence,
                 "checker_status": "unverified",
             })
+            if len(certs) >= MAX_TEMPORAL_CERTIFICATES:
+                raise _CertificateLimitReached
             return
 
         step = sequence[i]
@@ -202,18 +233,24 @@ def find_temporal_certificates(model: str, revision: str, run_id: str, rule: Rul
             backtrack(i + 1, chosen)
             chosen.pop(var, None)
 
-    backtrack(0, {})
-    return certs[:50]  # avoid certificate explosion in MVP
+    try:
+        backtrack(0, {})
+    except _CertificateLimitReached:
+        pass
+    return certs
 
 
 def run_rulecheck(model: str, revision: str, run_id: str, rules: Iterable[Rule], evidence_nodes: List[Evidence]) -> List[Certificate]:
     certificates: List[Certificate] = []
+    index: Optional[EvidenceIndex] = None
     for rule in rules:
         rule_type = rule.get("type")
         if rule_type in {"static", "config", "environment", "runtime"}:
             certificates.extend(find_single_evidence_certificates(model, revision, run_id, rule, evidence_nodes))
         elif rule_type == "cross_layer_correlation":
-            certificates.extend(find_cross_layer_certificates(model, revision, run_id, rule, evidence_nodes))
+            if index is None:
+                index = index_evidence(evidence_nodes)
+            certificates.extend(find_cross_layer_certificates(model, revision, run_id, rule, evidence_nodes, index))
         elif rule_type == "temporal_dataflow":
             certificates.extend(find_temporal_certificates(model, revision, run_id, rule, evidence_nodes))
     return certificates
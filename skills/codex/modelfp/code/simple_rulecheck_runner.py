@@ -14,7 +14,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional
 import yaml
 
 from certificate_checker import verify_certificate
-from rulecheck_engine import flatten_policy
+from rulecheck_engine import candidate_evidence, flatten_policy, index_evidence
 
 Evidence = Dict[str, Any]
 Rule = Dict[str, Any]
@@ -131,10 +131,14 @@ def run_temporal_rules(policy: Mapping[str, Any], evidence: List[Evidence], cont
 
 def run_cross_layer_rules(policy: Mapping[str, Any], evidence: List[Evidence], context: Mapping[str, str]) -> List[Dict[str, Any]]:
     certs: List[Dict[str, Any]] = []
-    for rule in policy.get("cross_layer_rules", []):
+    rules = policy.get("cross_layer_rules", [])
+    index = index_evidence(evidence) if rules else {}
+    for rule in rules:
         conds = rule.get("conditions", {})
-        static_matches = [e for e in evidence if matches(e, conds.get("static", {}))]
-        runtime_matches = [e for e in evidence if matches(e, conds.get("runtime", {}))]
+        static_cond = conds.get("static", {})
+        runtime_cond = conds.get("runtime", {})
+        static_matches = [e for e in candidate_evidence(index, evidence, static_cond) if matches(e, static_cond)]
+        runtime_matches = [e for e in candidate_evidence(index, evidence, runtime_cond) if matches(e, runtime_cond)]
         for s in static_matches:
             for r in runtime_matches:
                 certs.append({
@@ -5,8 +5,8 @@ open/read/write/connect/execve and fd mappings. Raw logs are still preserved.
 """
 from __future__ import annotations
 
-import glob
 import ipaddress
+import mmap
 import os
 import re
 from pathlib import Path
@@ -18,6 +18,8 @@ READ_RE = re.compile(r'read\((?P<fd>\d+),.*\)\s+=\s+(?P<ret>-?\d+)')
 WRITE_RE = re.compile(r'write\((?P<fd>\d+),.*\)\s+=\s+(?P<ret>-?\d+)')
 CONNECT_RE = re.compile(r'connect\((?P<fd>\d+),.*?(sin_addr=inet_addr\("(?P<ip>[^"]+)"\)|inet_addr\("(?P<ip2>[^"]+)"\)).*\)\s+=\s+(?P<ret>-?\d+)')
 TIME_RE = re.compile(r'^(?P<time>\d{2}:\d{2}:\d{2}(?:\.\d+)?)\s+')
+# Selects, straight from the mapped log bytes, only lines naming a syscall we parse.
+CANDIDATE_LINE_RE = re.compile(rb'^(?:\d{2}:\d{2}:\d{2}(?:\.\d+)?[ \t]+)?(?:openat|open|execve|connect|read|write)\([^\r\n]*', re.M)
 
 SECRET_PATTERNS = [
     re.compile(r"/home/[^/]+/\.ssh/"),
@@ -26,6 +28,7 @@ SECRET_PATTERNS = [
     re.compile(r"/home/[^/]+/\.config/gcloud/"),
     re.compile(r"/home/[^/]+/\.kube/config"),
 ]
+SECRET_RE = re.compile("|".join(f"(?:{p.pattern})" for p in SECRET_PATTERNS))
 SHELL_PATHS = {"/bin/sh", "/bin/bash", "/usr/bin/sh", "/usr/bin/bash"}
 
 
@@ -40,7 +43,7 @@ def _path_class(path: str) -> Optional[str]:
         return "docker_socket"
     if path in {"/etc/passwd", "/etc/shadow", "/etc/sudoers"}:
         return "system_sensitive"
-    if any(p.search(path) for p in SECRET_PATTERNS):
+    if SECRET_RE.search(path):
         return "secret"
     return None
 
@@ -63,19 +66,37 @@ def _pid_from_filename(path: str) -> Optional[int]:
         return None
 
 
+def _candidate_lines(file_path: str) -> List[str]:
+    with open(file_path, "rb") as fp:
+        try:
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty log files cannot be mapped
+            return []
+        with mm:
+            return [m.group(0).decode("utf-8", errors="replace") for m in CANDIDATE_LINE_RE.finditer(mm)]
+
+
+def _strace_files(base: str) -> List[str]:
+    """List the per-process logs written by ``strace -ff -o base`` (``base``, ``base.<pid>``)."""
+    dirname, prefix = os.path.split(base)
+    try:
+        with os.scandir(dirname or ".") as entries:
+            return sorted(os.path.join(dirname, e.name) for e in entries if e.name.startswith(prefix) and e.is_file())
+    except OSError:
+        return []
+
+
 def parse_strace_logs(strace_base: str | Path, model: str, revision: str, run_id: str, phase: str = "LOAD") -> List[Dict[str, Any]]:
     base = str(strace_base)
-    files = sorted(glob.glob(base + "*"))
+    files = _strace_files(base)
     evidence: List[Dict[str, Any]] = []
     fd_labels: Dict[tuple[int | None, int], Dict[str, Any]] = {}
     idx = 1
 
     for file_path in files:
-        if os.path.isdir(file_path):
-            continue
         pid = _pid_from_filename(file_path)
         try:
-            lines = Path(file_path).read_text(encoding="utf-8", errors="replace").splitlines()
+            lines = _candidate_lines(file_path)
         except Exception:
             continue
         for line in lines:
@@ -85,49 +106,47 @@ def parse_strace_logs(strace_base: str | Path, model: str, revision: str, run_id
             body = TIME_RE.sub("", line, count=1)
 
             ev: Optional[Dict[str, Any]] = None
-            m = OPEN_RE.search(body)
-            if m:
-                ret = int(m.group("ret"))
-                path = m.group("path")
-                rest = m.group("rest")
-                mode = "write_or_create" if any(flag in rest for flag in ["O_WRONLY", "O_RDWR", "O_CREAT", "O_TRUNC"]) else "read"
-                ev = {
-                    "op": "open",
-                    "path": path,
-                    "mode": mode,
-                    "result": _result(ret),
-                    "fd": ret if ret >= 0 else None,
-                    "path_class": _path_class(path),
-                }
-                if ret >= 0:
-                    fd_labels[(pid, ret)] = {"path": path, "path_class": ev.get("path_class"), "fd_kind": "file"}
-            else:
-                m = EXEC_RE.search(body)
+            # Dispatch on the leading syscall name so each line runs at most one regex;
+            # read/write dominate real traces, so they are tested first.
+            syscall = body.split("(", 1)[0]
+            if syscall in ("read", "write"):
+                m = (READ_RE if syscall == "read" else WRITE_RE).match(body)
+                if m:
+                    fd = int(m.group("fd")); ret = int(m.group("ret"))
+                    label = fd_labels.get((pid, fd), {})
+                    ev = {"op": syscall, "fd": fd, "result": _result(ret), **label}
+            elif syscall in ("open", "openat"):
+                m = OPEN_RE.match(body)
+                if m:
+                    ret = int(m.group("ret"))
+                    path = m.group("path")
+                    rest = m.group("rest")
+                    mode = "write_or_create" if any(flag in rest for flag in ["O_WRONLY", "O_RDWR", "O_CREAT", "O_TRUNC"]) else "read"
+                    ev = {
+                        "op": "open",
+                        "path": path,
+                        "mode": mode,
+                        "result": _result(ret),
+                        "fd": ret if ret >= 0 else None,
+                        "path_class": _path_class(path),
+                    }
+                    if ret >= 0:
+                        fd_labels[(pid, ret)] = {"path": path, "path_class": ev.get("path_class"), "fd_kind": "file"}
+            elif syscall == "execve":
+                m = EXEC_RE.match(body)
                 if m:
                     ret = int(m.group("ret"))
                     path = m.group("path")
                     ev = {"op": "execve", "path": path, "result": _result(ret), "path_class": _path_class(path)}
-                else:
-                    m = CONNECT_RE.search(body)
-                    if m:
-                        ret = int(m.group("ret"))
-                        fd = int(m.group("fd"))
-                        ip = m.group("ip") or m.group("ip2") or ""
-                        ev = {"op": "connect", "fd": fd, "dst_ip": ip, "dst_type": _dst_type(ip), "result": _result(ret)}
-                        if ret >= 0:
-                            fd_labels[(pid, fd)] = {"dst_ip": ip, "dst_type": ev.get("dst_type"), "fd_kind": "socket"}
-                    else:
-                        m = READ_RE.search(body)
-                        if m:
-                            fd = int(m.group("fd")); ret = int(m.group("ret"))
-                            label = fd_labels.get((pid, fd), {})
-                            ev = {"op": "read", "fd": fd, "result": _result(ret), **label}
-                        else:
-                            m = WRITE_RE.search(body)
-                            if m:
-                                fd = int(m.group("fd")); ret = int(m.group("ret"))
-                                label = fd_labels.get((pid, fd), {})
-                                ev = {"op": "write", "fd": fd, "result": _result(ret), **label}
+            elif syscall == "connect":
+                m = CONNECT_RE.match(body)
+                if m:
+                    ret = int(m.group("ret"))
+                    fd = int(m.group("fd"))
+                    ip = m.group("ip") or m.group("ip2") or ""
+                    ev = {"op": "connect", "fd": fd, "dst_ip": ip, "dst_type": _dst_type(ip), "result": _result(ret)}
+                    if ret >= 0:
+                        fd_labels[(pid, fd)] = {"dst_ip": ip, "dst_type": ev.get("dst_type"), "fd_kind": "socket"}
 
             if ev is not None:
                 ev.update({
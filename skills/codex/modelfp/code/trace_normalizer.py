@@ -4,21 +4,27 @@ from __future__ import annotations
 
 import ipaddress
 import json
+import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 STRACE_RE = re.compile(r"^(?:(?P<ts>\d{2}:\d{2}:\d{2}(?:\.\d+)?)\s+)?(?P<syscall>[A-Za-z_][A-Za-z0-9_]*)\((?P<args>.*)\)\s+=\s+(?P<ret>.+?)(?:\s+<(?P<dur>[0-9.]+)>)?$")
 QUOTED_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
 PORT_RE = re.compile(r"sin_port=htons\((\d+)\)")
 IP_RE = re.compile(r"inet_addr\(\"([^\"]+)\"\)|inet_pton\([^,]+, \"([^\"]+)\"")
+LEADING_INT_RE = re.compile(r"(\d+)")
 
 SECRET_PATH_PATTERNS = [
     re.compile(r"/\.ssh/"), re.compile(r"/\.aws/credentials"), re.compile(r"/\.config/gcloud/"),
     re.compile(r"/\.kube/config"), re.compile(r"/etc/shadow"), re.compile(r"/etc/sudoers"),
 ]
 SYSTEM_PATHS = [re.compile(r"^/etc/passwd$"), re.compile(r"^/etc/shadow$"), re.compile(r"^/etc/sudoers")]
+SECRET_PATH_RE = re.compile("|".join(f"(?:{p.pattern})" for p in SECRET_PATH_PATTERNS))
+SYSTEM_PATH_RE = re.compile("|".join(f"(?:{p.pattern})" for p in SYSTEM_PATHS))
 SHELLS = {"/bin/sh", "/bin/bash", "/usr/bin/sh", "/usr/bin/bash", "/bin/zsh", "/usr/bin/zsh"}
 
 TYPE_MAP = {
@@ -47,7 +53,7 @@ def _result_success(ret: str) -> bool:
 
 
 def _parse_ret_fd(ret: str) -> Optional[int]:
-    m = re.match(r"(\d+)", ret.strip())
+    m = LEADING_INT_RE.match(ret.strip())
     return int(m.group(1)) if m else None
 
 
@@ -63,9 +69,9 @@ def _path_class(path: Optional[str]) -> Optional[str]:
         return "shell"
     if path == "/var/run/docker.sock":
         return "docker_socket"
-    if any(p.search(path) for p in SECRET_PATH_PATTERNS):
+    if SECRET_PATH_RE.search(path):
         return "secret"
-    if any(p.search(path) for p in SYSTEM_PATHS):
+    if SYSTEM_PATH_RE.search(path):
         return "system_sensitive"
     if path.startswith("/tmp/") and path.endswith((".py", ".sh", ".so", ".elf")):
         return "tmp_executable"
@@ -84,19 +90,28 @@ def _is_external_ip(ip: Optional[str]) -> Optional[bool]:
 
 def _parse_fd_arg(args: str) -> Optional[int]:
     first = args.split(",", 1)[0].strip()
-    m = re.match(r"(\d+)", first)
+    m = LEADING_INT_RE.match(first)
     return int(m.group(1)) if m else None
 
 
+def _iter_lines(path: Path) -> Iterator[str]:
+    """Stream lines through a 1 MiB binary buffer rather than decoding the whole log up front."""
+    with path.open("rb", buffering=1 << 20) as fp:
+        for raw in fp:
+            yield raw.decode("utf-8", errors="ignore").rstrip("\r\n")
+
+
 def parse_strace_file(path: Path, id_start: int = 1) -> Tuple[List[Dict[str, Any]], int]:
     nodes: List[Dict[str, Any]] = []
     next_id = id_start
     pid = path.name.rsplit(".", 1)[-1] if "." in path.name else None
+    pid_value = int(pid) if pid and pid.isdigit() else pid
+    file_str = str(path)
     fd_labels: Dict[int, Dict[str, Any]] = {}
 
-    for line_no, line in enumerate(path.read_text(errors="ignore").splitlines(), start=1):
+    for line_no, line in enumerate(_iter_lines(path), start=1):
         line = line.strip()
-        if not line or line.startswith("+++") or line.startswith("---"):
+        if not line or line.startswith(("+++", "---")):
             continue
         m = STRACE_RE.match(line)
         if not m:
@@ -109,15 +124,14 @@ def parse_strace_file(path: Path, id_start: int = 1) -> Tuple[List[Dict[str, Any
             "id": f"E{next_id:06d}",
             "source": "strace",
             "evidence_type": "runtime_event",
-            "time": time.time(),
             "trace_time": m.group("ts"),
-            "pid": int(pid) if pid and pid.isdigit() else pid,
+            "pid": pid_value,
             "phase": "LOAD_AND_INFERENCE",
             "op": syscall,
             "result": "success" if success else "failure",
             "raw": line[:3000],
             "line_no": line_no,
-            "file": str(path),
+            "file": file_str,
         }
 
         if syscall in {"open", "openat", "creat"}:
@@ -184,12 +198,68 @@ def parse_strace_file(path: Path, id_start: int = 1) -> Tuple[List[Dict[str, Any
     return nodes, next_id
 
 
+def list_strace_files(traces_dir: Path) -> List[Tuple[Path, int]]:
+    """Return ``(path, size)`` for the ``strace*`` per-process logs in ``traces_dir`` in name order."""
+    found: List[Tuple[Path, int]] = []
+    try:
+        with os.scandir(traces_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith("strace"):
+                    continue
+                try:
+                    if entry.is_file():
+                        found.append((Path(entry.path), entry.stat().st_size))
+                except OSError:
+                    continue  # removed or unreadable since the directory was listed
+    except OSError:
+        return []
+    return sorted(found)
+
+
+def parse_strace_files(files: List[Tuple[Path, int]], id_start: int = 1, workers: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse strace -ff per-process logs, in parallel when there is more than one.
+
+    Files are independent (fd labels are per process), so workers parse them
+    separately; evidence IDs and times are assigned afterwards in file order
+    so the merged graph does not depend on worker scheduling.
+    ``files`` are ``(path, size)`` pairs from ``list_strace_files``.
+    ``workers=0`` uses one process per CPU; ``workers=1`` parses serially.
+    """
+    paths = [path for path, _ in files]
+    parsed: List[List[Dict[str, Any]]] = []
+    if workers != 1 and len(paths) > 1:
+        # Start the largest logs first so one big process trace does not finish last.
+        by_size = [path for path, _ in sorted(files, key=lambda f: f[1], reverse=True)]
+        try:
+            # The fork pool starts every worker up front, so never ask for more than there are files.
+            with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(paths))) as pool:
+                results = dict(zip(by_size, pool.map(parse_strace_file, by_size)))
+            parsed = [results[path][0] for path in paths]
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            parsed = []  # no usable process pool (restricted /dev/shm, killed worker); parse serially
+    if not parsed:
+        parsed = [parse_strace_file(path)[0] for path in paths]
+
+    # Times are spaced explicitly: back-to-back time.time() calls can land only
+    # an ulp or two apart, too close for the strict "<" ordering rules rely on.
+    base_time = time.time()
+    nodes: List[Dict[str, Any]] = []
+    next_id = id_start
+    for file_nodes in parsed:
+        for node in file_nodes:
+            node["id"] = f"E{next_id:06d}"
+            node["time"] = base_time + (next_id - id_start) * 1e-6
+            next_id += 1
+            nodes.append(node)
+    return nodes, next_id
+
+
 def parse_audit_jsonl(path: Path, id_start: int) -> Tuple[List[Dict[str, Any]], int]:
     nodes: List[Dict[str, Any]] = []
     next_id = id_start
     if not path.exists():
         return nodes, next_id
-    for line_no, line in enumerate(path.read_text(errors="ignore").splitlines(), start=1):
+    for line_no, line in enumerate(_iter_lines(path), start=1):
         if not line.strip():
             continue
         try:
@@ -225,7 +295,7 @@ def read_jsonl(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
     out = []
-    for line in path.read_text(errors="ignore").splitlines():
+    for line in _iter_lines(path):
         if not line.strip():
             continue
         try:
@@ -256,7 +326,7 @@ def normalize_node(ev: Dict[str, Any], model: str, revision: str, run_id: str) -
     return node
 
 
-def build_evidence_graph(out_dir: Path, model: str = "local/model", revision: str = "local", run_id: str = "local-run") -> Dict[str, Any]:
+def build_evidence_graph(out_dir: Path, model: str = "local/model", revision: str = "local", run_id: str = "local-run", workers: int = 0) -> Dict[str, Any]:
     evidence: List[Dict[str, Any]] = []
     for name in [
         "all_files_static_evidence.jsonl",
@@ -273,12 +343,7 @@ def build_evidence_graph(out_dir: Path, model: str = "local/model", revision: st
     ]:
         evidence.extend(read_jsonl(out_dir / "evidence" / name))
 
-    next_id = 1
-    runtime: List[Dict[str, Any]] = []
-    for sf in sorted((out_dir / "traces").glob("strace*")):
-        if sf.name.endswith(".log") or sf.name.startswith("strace"):
-            parsed, next_id = parse_strace_file(sf, next_id)
-            runtime.extend(parsed)
+    runtime, next_id = parse_strace_files(list_strace_files(out_dir / "traces"), 1, workers=workers)
     audit_nodes, next_id = parse_audit_jsonl(out_dir / "traces" / "python_audit.jsonl", next_id)
     runtime.extend(audit_nodes)
     evidence.extend(runtime)
@@ -304,8 +369,11 @@ def main() -> int:
     parser.add_argument("--model", default="local/model")
     parser.add_argument("--revision", default="local")
     parser.add_argument("--run-id", default="local-run")
+    parser.add_argument("--workers", type=int, default=0, help="Processes for parsing strace logs; 0 = one per CPU, 1 = serial")
     args = parser.parse_args()
-    graph = build_evidence_graph(Path(args.out_dir), model=args.model, revision=args.revision, run_id=args.run_id)
+    if args.workers < 0:
+        parser.error("--workers must be 0 or a positive number of processes")
+    graph = build_evidence_graph(Path(args.out_dir), model=args.model, revision=args.revision, run_id=args.run_id, workers=args.workers)
     out = Path(args.output); out.parent.mkdir(parents=True, exist_ok=True)
     out.write_text(json.dumps(graph, ensure_ascii=False, indent=2), encoding="utf-8")
     print(str(out))
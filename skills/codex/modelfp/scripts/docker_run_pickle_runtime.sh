@@ -55,18 +55,23 @@ while IFS= read -r rel; do
     -e PYTHONDONTWRITEBYTECODE=1 \
     -e PYTHONUNBUFFERED=1 \
     -e MODELFP_PICKLE_TIMEOUT="$TIMEOUT" \
+    -e MODELFP_STRACE_SYSCALLS="${MODELFP_STRACE_SYSCALLS:-}" \
     -v "$MODEL_ABS:/workspace/repo:ro" \
     -v "$artifact_out:/workspace/out:rw" \
     --entrypoint sh \
     "$IMAGE" \
     -c 'set -eu
+      artifact="$1"
+      # Same syscall filter as modelfp_docker_runner.py; MODELFP_STRACE_SYSCALLS=all traces everything.
+      syscalls="${MODELFP_STRACE_SYSCALLS:-$(cd /workspace/ModelFP_skill/code && python -c "from modelfp_docker_runner import STRACE_SYSCALLS; print(\",\".join(\"?\" + name for name in STRACE_SYSCALLS))")}"
+      if [ "$syscalls" = all ]; then set --; else set -- -e "trace=$syscalls"; fi
       timeout "${MODELFP_PICKLE_TIMEOUT:-30}" \
-        strace -ff -tt -T -yy -s 4096 -o /workspace/out/traces/strace \
+        strace -ff -qq -tt -T -yy -s 4096 "$@" -o /workspace/out/traces/strace \
           python /workspace/ModelFP_skill/code/audit_runner.py \
             --script /workspace/ModelFP_skill/code/pickle_runtime_target.py \
             --audit-log /workspace/out/traces/python_audit.jsonl \
             --phase PICKLE_RUNTIME \
-            -- --artifact "/workspace/repo/$1" --out /workspace/out/pickle_runtime_observations.json \
+            -- --artifact "/workspace/repo/$artifact" --out /workspace/out/pickle_runtime_observations.json \
         > /workspace/out/traces/target_stdout.log \
         2> /workspace/out/traces/target_stderr.log' sh "$rel"
   rc=$?